@@ -4,15 +4,118 @@ Common library functions for Playwright automation
 
 import yaml
 import os
+import re
+import sys
+import time
+import glob
+import hashlib
+import json
+from collections import OrderedDict
+from types import MappingProxyType
+import asyncio
+from playwright import async_api
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
-from typing import Dict, Any, Optional
+from playwright.sync_api import Error as PlaywrightError
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Tuple, Union
+from settings import settings
+
+# (name, locator, matcher, description, error) for one element in locator.yaml,
+# where matcher is the expected text, or a compiled pattern for 'regex: true'
+# elements, and error describes what is wrong with a malformed element
+LocatorSpec = Tuple[str, Any, Union[str, Pattern[str], Any], str, Optional[str]]
+
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed YAML files keyed by absolute path ->
+# [st_mtime_ns, st_size, read-only data, element specs or None until first needed]
+_CacheEntry = List[Any]
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+
+# Extra launch flags for Chromium; the other browsers do not use them
+_CHROMIUM_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+)
+
+# Prebuilt keyword arguments for browser launch and context creation
+_CHROMIUM_LAUNCH_KWARGS = {"headless": settings.HEADLESS, "args": list(_CHROMIUM_ARGS)}
+_LAUNCH_KWARGS = {"headless": settings.HEADLESS}
+_CONTEXT_KWARGS = {"viewport": settings.VIEWPORT}
+
+# Plain CSS selectors start with an id, class, attribute, tag or universal selector
+_CSS_RE = re.compile(r'^[#.\[a-zA-Z*]')
+# Playwright selector engines (text=, role=, xpath, >> chains) and pseudo-classes
+# that are not valid CSS and need the slower locator engine
+_PLAYWRIGHT_SELECTOR_RE = re.compile(
+    r'^[\w-]+=|^//|>>|:visible\b'
+    r'|:(?:has-text|text|text-is|text-matches|nth-match|left-of|right-of|above|below|near)\('
+)
+
+# The one visibility and text rule shared by every probe below: an element is
+# visible when it has a non-empty box and is not visibility:hidden
+_ELEMENT_STATE_JS = """(el) => {
+        if (!el) {
+            return {visible: false};
+        }
+        const rect = el.getBoundingClientRect();
+        const visible = rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+        return {visible: visible, text: (el.textContent || '').trim()};
+    }"""
+
+# Resolves every locator in one round-trip and reports visibility and text.
+# Selectors that document.querySelector rejects (Playwright-only syntax such
+# as :has-text) are flagged as unsupported and resolved through page.locator.
+_PROBE_ELEMENTS_JS = """
+(items) => {
+    const elementState = """ + _ELEMENT_STATE_JS + """;
+    return items.map((it) => {
+        let el;
+        try {
+            el = document.querySelector(it.sel);
+        } catch (e) {
+            return {name: it.name, supported: false};
+        }
+        return Object.assign({name: it.name, supported: true}, elementState(el));
+    });
+}
+"""
+
+# Readiness check for the plain CSS locators: true once all of them are visible
+_ALL_VISIBLE_JS = """
+(sels) => {
+    const elementState = """ + _ELEMENT_STATE_JS + """;
+    return sels.every((sel) => elementState(document.querySelector(sel)).visible);
+}
+"""
+
+# Same check for a single Playwright locator: visibility and text of its first
+# match in one round-trip, without waiting if nothing matches
+_PROBE_MATCHES_JS = """
+(els) => {
+    const elementState = """ + _ELEMENT_STATE_JS + """;
+    return elementState(els[0]);
+}
+"""
+
 
 class PlaywrightManager:
     def __init__(self):
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self.pages: List[Page] = []
         self.page: Optional[Page] = None
+        self.connected_over_cdp = False
 
     def open_url(self, url: str, browser_type: str = "chromium") -> Page:
         """
@@ -25,171 +128,805 @@ class PlaywrightManager:
         Returns:
             Page: Playwright page object
         """
+        return self.open_urls([url], browser_type)[0]
+
+    def open_urls(self, urls: List[str], browser_type: str = "chromium") -> List[Page]:
+        """
+        Opens each URL in its own tab of a single shared browser context.
+        
+        The browser and context are created on the first call and reused
+        afterwards, so the tabs share cookies, HTTP cache and connections.
+        The last opened tab becomes the current page.
+        
+        Args:
+            urls (List[str]): The URLs to navigate to
+            browser_type (str): Browser type (chromium, firefox, webkit)
+            
+        Returns:
+            List[Page]: Playwright page objects, in the same order as urls
+        """
+        url = urls[0] if urls else None
         try:
-            # Initialize Playwright
-            self.playwright = sync_playwright().start()
+            self._ensure_context(browser_type)
             
-            # Launch browser based on type
-            browser_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
+            opened = []
+            for url in urls:
+                page = self.context.new_page()
+                self.pages.append(page)
+                self.page = page
+                opened.append(page)
+                
+                # Navigate to URL
+                print(f"Navigating to: {url}")
+                page.goto(url, timeout=settings.TIMEOUT, wait_until="domcontentloaded")
+                
+                # Assert current URL matches expected URL
+                current_url = page.url
+                if not current_url.startswith(url.rstrip('/')):
+                    print(f"Warning: Current URL ({current_url}) doesn't match expected URL ({url})")
+                else:
+                    print(f"Successfully navigated to: {current_url}")
             
-            if browser_type.lower() == "chromium":
-                self.browser = self.playwright.chromium.launch(
-                    headless=True,
-                    args=browser_args
-                )
-            elif browser_type.lower() == "firefox":
-                self.browser = self.playwright.firefox.launch(headless=True)
-            elif browser_type.lower() == "webkit":
-                self.browser = self.playwright.webkit.launch(headless=True)
-            else:
-                raise ValueError(f"Unsupported browser type: {browser_type}")
-            
-            # Create context and page
-            self.context = self.browser.new_context(viewport={"width": 1280, "height": 720})
-            self.page = self.context.new_page()
-            
-            # Navigate to URL
-            print(f"Navigating to: {url}")
-            self.page.goto(url, timeout=30000)
-            
-            # Wait for page to load
-            self.page.wait_for_load_state("networkidle")
-            
-            # Assert current URL matches expected URL
-            current_url = self.page.url
-            if not current_url.startswith(url.rstrip('/')):
-                print(f"Warning: Current URL ({current_url}) doesn't match expected URL ({url})")
-            else:
-                print(f"Successfully navigated to: {current_url}")
-            
-            return self.page
+            return opened
             
         except Exception as e:
             print(f"Error opening URL {url}: {str(e)}")
             self.teardown()
             raise
 
-    def validate_element_from_data(self, yaml_file_path: str) -> bool:
+    def _ensure_context(self, browser_type: str):
+        """
+        Launches (or connects to) the browser and creates the shared context once.
+        
+        Args:
+            browser_type (str): Browser type (chromium, firefox, webkit)
+        """
+        if self.context is not None:
+            return
+        
+        self._ensure_playwright()
+        
+        # A browser kept by teardown(keep_browser=True) only needs a new context
+        if self.browser is None:
+            self._launch_browser(browser_type)
+        
+        self.context = self.browser.new_context(**_CONTEXT_KWARGS)
+
+    def _launch_browser(self, browser_type: str):
+        """
+        Launches the browser, or connects to the shared one when CDP_ENDPOINT is set.
+        
+        Args:
+            browser_type (str): Browser type (chromium, firefox, webkit)
+        """
+        if browser_type.lower() == "chromium" and settings.CDP_ENDPOINT:
+            # Attach to an already running browser instead of launching one
+            print(f"Connecting to browser at: {settings.CDP_ENDPOINT}")
+            self.browser = self.playwright.chromium.connect_over_cdp(settings.CDP_ENDPOINT)
+            self.connected_over_cdp = True
+        else:
+            launch_kwargs = _launch_kwargs(browser_type)
+            self.browser = getattr(self.playwright, browser_type.lower()).launch(**launch_kwargs)
+
+    def _ensure_playwright(self):
+        """
+        Starts Playwright on first use and reuses it on later calls.
+        """
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+
+    def validate_element_from_data(self, yaml_file_path: str, page: Optional[Page] = None) -> bool:
         """
         Validates elements on the page based on data from YAML file.
         
         Args:
             yaml_file_path (str): Path to the YAML file containing element data
+            page (Optional[Page]): Tab to validate, defaults to the current page
             
         Returns:
             bool: True if all validations pass, False otherwise
         """
-        if not self.page:
+        page = page or self.page
+        if not page:
             raise RuntimeError("Page not initialized. Call open_url first.")
         
         try:
-            # Load YAML data
-            with open(yaml_file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-            
-            if 'elements' not in data:
-                raise ValueError("YAML file must contain 'elements' key")
+            specs = _prepare_validation(yaml_file_path)
+            css_selectors, playwright_locators = _readiness_targets(specs)
             
-            elements = data['elements']
-            all_passed = True
+            # Wait until every element is visible (or the timeout runs out)
+            # before probing, so late-rendering elements aren't reported missing
+            deadline = time.monotonic() + settings.TIMEOUT / 1000
+            if css_selectors:
+                try:
+                    page.wait_for_function(_ALL_VISIBLE_JS, arg=css_selectors, timeout=settings.TIMEOUT)
+                except PlaywrightError as e:
+                    # Timeouts, bad selector syntax or navigation: let the probe report it
+                    print(f"Warning: Not all CSS locators became visible: {str(e)}")
+            for locator in playwright_locators:
+                remaining = (deadline - time.monotonic()) * 1000
+                if remaining <= 0:
+                    print("Warning: Timed out waiting for elements to become visible")
+                    break
+                try:
+                    page.locator(locator).first.wait_for(state="visible", timeout=remaining)
+                except PlaywrightError as e:
+                    print(f"Warning: Could not wait for '{locator}' to become visible: {str(e)}")
             
-            print(f"\\nValidating {len(elements)} elements...")
+            # Probe all plain CSS elements in the browser with a single evaluate call,
+            # skipping the round-trip when every locator needs the Playwright engine
+            results = {}
+            payload = _css_payload(specs)
+            if payload:
+                for result in page.evaluate(_PROBE_ELEMENTS_JS, payload):
+                    results[result['name']] = result
             
-            for element_name, element_data in elements.items():
+            # Resolve the remaining Playwright-specific locators one by one
+            page_locator = page.locator
+            for element_name, locator in _pending_locators(specs, results):
                 try:
-                    locator = element_data['locator']
-                    expected_text = element_data['expected_text']
-                    description = element_data.get('description', element_name)
-                    
-                    print(f"\\nValidating: {description}")
-                    print(f"  Locator: {locator}")
-                    print(f"  Expected text: '{expected_text}'")
-                    
-                    # Find element using locator
-                    element = self.page.locator(locator).first
-                    
-                    # Check if element is visible
-                    if not element.is_visible():
-                        print(f"  ❌ ERROR: Element '{description}' is not visible on the page")
-                        all_passed = False
-                        continue
-                    
-                    # Get actual text from element
-                    actual_text = element.text_content().strip()
-                    
-                    # Compare expected vs actual text
-                    if actual_text == expected_text:
-                        print(f"  ✅ SUCCESS: Text matches - '{actual_text}'")
-                    else:
-                        print(f"  ❌ ERROR: Text mismatch for '{description}'")
-                        print(f"     Expected: '{expected_text}'")
-                        print(f"     Actual: '{actual_text}'")
-                        all_passed = False
-                        
-                except Exception as e:
-                    print(f"  ❌ ERROR: Failed to validate '{description}': {str(e)}")
-                    all_passed = False
-            
-            print(f"\\n{'='*50}")
-            if all_passed:
-                print("🎉 All element validations PASSED!")
-            else:
-                print("❌ Some element validations FAILED!")
-            print(f"{'='*50}")
-            
-            return all_passed
+                    results[element_name] = page_locator(locator).evaluate_all(_PROBE_MATCHES_JS)
+                except PlaywrightError as e:
+                    results[element_name] = e
+            
+            return _report_results(specs, results)
             
         except Exception as e:
             print(f"Error validating elements: {str(e)}")
             return False
 
-    def teardown(self):
+    def teardown(self, keep_browser: bool = False):
         """
         Closes the browser and cleans up resources.
+        
+        Safe to call more than once; later calls are no-ops.
+        
+        Args:
+            keep_browser (bool): Only close the pages and context, leaving the
+                browser and Playwright running for the next open_url call in
+                the same process.
         """
+        if self.playwright is None:
+            return
+        
         try:
-            if self.page:
-                self.page.close()
-                self.page = None
-                
-            if self.context:
+            for page in self.pages:
+                page.close()
+            self.pages = []
+            self.page = None
+            
+            if self.context is not None:
                 self.context.close()
                 self.context = None
-                
-            if self.browser:
-                self.browser.close()
+            
+            if keep_browser:
+                print("Browser kept open for reuse.")
+                return
+            
+            if self.browser is not None:
+                # Leave a shared browser running for the next run
+                if not self.connected_over_cdp:
+                    self.browser.close()
                 self.browser = None
-                
-            if self.playwright:
-                self.playwright.stop()
-                self.playwright = None
-                
+                self.connected_over_cdp = False
+            
+            self.playwright.stop()
+            self.playwright = None
+            
             print("Browser closed successfully.")
             
         except Exception as e:
             print(f"Error during teardown: {str(e)}")
 
 
-def load_locator_data(yaml_file_path: str) -> Dict[str, Any]:
+class AsyncPlaywrightManager:
+    """
+    asyncio counterpart of PlaywrightManager built on playwright.async_api.
+    
+    Tabs opened together are navigated concurrently, and elements that need
+    the Playwright locator engine are probed concurrently.
+    """
+
+    def __init__(self):
+        self.playwright = None
+        self.browser: Optional[async_api.Browser] = None
+        self.context: Optional[async_api.BrowserContext] = None
+        self.pages: List[async_api.Page] = []
+        self.page: Optional[async_api.Page] = None
+        self.connected_over_cdp = False
+
+    async def open_url(self, url: str, browser_type: str = "chromium") -> async_api.Page:
+        """
+        Opens a URL in the specified browser and returns the page object.
+        
+        Args:
+            url (str): The URL to navigate to
+            browser_type (str): Browser type (chromium, firefox, webkit)
+            
+        Returns:
+            async_api.Page: Playwright page object
+        """
+        return (await self.open_urls([url], browser_type))[0]
+
+    async def open_urls(self, urls: List[str], browser_type: str = "chromium") -> List[async_api.Page]:
+        """
+        Opens each URL in its own tab of a single shared browser context, concurrently.
+        
+        Args:
+            urls (List[str]): The URLs to navigate to
+            browser_type (str): Browser type (chromium, firefox, webkit)
+            
+        Returns:
+            List[async_api.Page]: Playwright page objects, in the same order as urls
+        """
+        try:
+            await self._ensure_context(browser_type)
+            
+            opened = list(await asyncio.gather(*[self._open_page(url) for url in urls]))
+            self.pages.extend(opened)
+            if opened:
+                self.page = opened[-1]
+            return opened
+            
+        except Exception as e:
+            print(f"Error opening URL {', '.join(urls)}: {str(e)}")
+            await self.teardown()
+            raise
+
+    async def _open_page(self, url: str) -> async_api.Page:
+        """
+        Opens one URL in a new tab of the shared context.
+        
+        Args:
+            url (str): The URL to navigate to
+            
+        Returns:
+            async_api.Page: Playwright page object
+        """
+        page = await self.context.new_page()
+        
+        # Navigate to URL
+        print(f"Navigating to: {url}")
+        await page.goto(url, timeout=settings.TIMEOUT, wait_until="domcontentloaded")
+        
+        # Assert current URL matches expected URL
+        current_url = page.url
+        if not current_url.startswith(url.rstrip('/')):
+            print(f"Warning: Current URL ({current_url}) doesn't match expected URL ({url})")
+        else:
+            print(f"Successfully navigated to: {current_url}")
+        
+        return page
+
+    async def _ensure_context(self, browser_type: str):
+        """
+        Launches (or connects to) the browser and creates the shared context once.
+        
+        Args:
+            browser_type (str): Browser type (chromium, firefox, webkit)
+        """
+        if self.context is not None:
+            return
+        
+        await self._ensure_playwright()
+        
+        # A browser kept by teardown(keep_browser=True) only needs a new context
+        if self.browser is None:
+            await self._launch_browser(browser_type)
+        
+        self.context = await self.browser.new_context(**_CONTEXT_KWARGS)
+
+    async def _launch_browser(self, browser_type: str):
+        """
+        Launches the browser, or connects to the shared one when CDP_ENDPOINT is set.
+        
+        Args:
+            browser_type (str): Browser type (chromium, firefox, webkit)
+        """
+        if browser_type.lower() == "chromium" and settings.CDP_ENDPOINT:
+            # Attach to an already running browser instead of launching one
+            print(f"Connecting to browser at: {settings.CDP_ENDPOINT}")
+            self.browser = await self.playwright.chromium.connect_over_cdp(settings.CDP_ENDPOINT)
+            self.connected_over_cdp = True
+        else:
+            launch_kwargs = _launch_kwargs(browser_type)
+            self.browser = await getattr(self.playwright, browser_type.lower()).launch(**launch_kwargs)
+
+    async def _ensure_playwright(self):
+        """
+        Starts Playwright on first use and reuses it on later calls.
+        """
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+    async def validate_element_from_data(self, yaml_file_path: str, page: Optional[async_api.Page] = None) -> bool:
+        """
+        Validates elements on the page based on data from YAML file.
+        
+        Args:
+            yaml_file_path (str): Path to the YAML file containing element data
+            page (Optional[async_api.Page]): Tab to validate, defaults to the current page
+            
+        Returns:
+            bool: True if all validations pass, False otherwise
+        """
+        page = page or self.page
+        if not page:
+            raise RuntimeError("Page not initialized. Call open_url first.")
+        
+        try:
+            specs = _prepare_validation(yaml_file_path)
+            css_selectors, playwright_locators = _readiness_targets(specs)
+            
+            # Wait concurrently until every element is visible (or the timeout
+            # runs out) before probing, so late-rendering elements aren't
+            # reported missing
+            waits = [
+                page.locator(locator).first.wait_for(state="visible", timeout=settings.TIMEOUT)
+                for locator in playwright_locators
+            ]
+            if css_selectors:
+                waits.append(page.wait_for_function(_ALL_VISIBLE_JS, arg=css_selectors, timeout=settings.TIMEOUT))
+            for error in await asyncio.gather(*waits, return_exceptions=True):
+                if isinstance(error, async_api.Error):
+                    # Timeouts, bad selector syntax or navigation: let the probe report it
+                    print(f"Warning: Not all elements became visible: {str(error)}")
+                elif isinstance(error, BaseException):
+                    raise error
+            
+            # Probe all plain CSS elements in the browser with a single evaluate call,
+            # skipping the round-trip when every locator needs the Playwright engine
+            results = {}
+            payload = _css_payload(specs)
+            if payload:
+                for result in await page.evaluate(_PROBE_ELEMENTS_JS, payload):
+                    results[result['name']] = result
+            
+            # Probe the remaining Playwright-specific locators concurrently
+            pending = _pending_locators(specs, results)
+            probed = await asyncio.gather(
+                *[self._probe(page, locator) for _, locator in pending],
+                return_exceptions=True
+            )
+            for (element_name, _), result in zip(pending, probed):
+                # Only Playwright errors count as an element failure
+                if isinstance(result, BaseException) and not isinstance(result, async_api.Error):
+                    raise result
+                results[element_name] = result
+            
+            return _report_results(specs, results)
+            
+        except Exception as e:
+            print(f"Error validating elements: {str(e)}")
+            return False
+
+    @staticmethod
+    async def _probe(page: async_api.Page, locator: str) -> Dict[str, Any]:
+        """
+        Reads visibility and text of the first match of a Playwright locator.
+        
+        Args:
+            page (async_api.Page): Page to query
+            locator (str): Locator string from the YAML file
+            
+        Returns:
+            Dict[str, Any]: {'visible': bool, 'text': str}
+        """
+        return await page.locator(locator).evaluate_all(_PROBE_MATCHES_JS)
+
+    async def teardown(self, keep_browser: bool = False):
+        """
+        Closes the browser and cleans up resources.
+        
+        Safe to call more than once; later calls are no-ops.
+        
+        Args:
+            keep_browser (bool): Only close the pages and context, leaving the
+                browser and Playwright running for the next open_url call in
+                the same process.
+        """
+        if self.playwright is None:
+            return
+        
+        try:
+            for page in self.pages:
+                await page.close()
+            self.pages = []
+            self.page = None
+            
+            if self.context is not None:
+                await self.context.close()
+                self.context = None
+            
+            if keep_browser:
+                print("Browser kept open for reuse.")
+                return
+            
+            if self.browser is not None:
+                # Leave a shared browser running for the next run
+                if not self.connected_over_cdp:
+                    await self.browser.close()
+                self.browser = None
+                self.connected_over_cdp = False
+            
+            await self.playwright.stop()
+            self.playwright = None
+            
+            print("Browser closed successfully.")
+            
+        except Exception as e:
+            print(f"Error during teardown: {str(e)}")
+
+
+def _launch_kwargs(browser_type: str) -> Dict[str, Any]:
+    """
+    Returns the launch keyword arguments for a browser type.
+    
+    Args:
+        browser_type (str): Browser type (chromium, firefox, webkit)
+        
+    Returns:
+        Dict[str, Any]: Keyword arguments for BrowserType.launch
+    """
+    browser_type = browser_type.lower()
+    if browser_type == "chromium":
+        return _CHROMIUM_LAUNCH_KWARGS
+    if browser_type in ("firefox", "webkit"):
+        return _LAUNCH_KWARGS
+    raise ValueError(f"Unsupported browser type: {browser_type}")
+
+
+def _prepare_validation(yaml_file_path: str) -> Tuple[LocatorSpec, ...]:
+    """
+    Loads the element specs for a validation run.
+    
+    Args:
+        yaml_file_path (str): Path to the YAML file containing element data
+        
+    Returns:
+        Tuple[LocatorSpec, ...]: Element specs
+    """
+    specs = load_locator_specs(yaml_file_path)
+    
+    print(f"\\nValidating {len(specs)} elements...")
+    
+    return specs
+
+
+def _readiness_targets(specs: Tuple[LocatorSpec, ...]) -> Tuple[List[str], List[str]]:
+    """
+    Splits the well-formed locators into what to wait for before probing.
+    
+    Args:
+        specs (Tuple[LocatorSpec, ...]): Element specs
+        
+    Returns:
+        Tuple[List[str], List[str]]: (plain CSS selectors, Playwright-specific locators)
+    """
+    css_selectors = []
+    playwright_locators = []
+    for _, locator, _, _, error in specs:
+        if error is None:
+            (css_selectors if _is_css_selector(locator) else playwright_locators).append(locator)
+    return css_selectors, playwright_locators
+
+
+def _css_payload(specs: Tuple[LocatorSpec, ...]) -> List[Dict[str, str]]:
+    """
+    Builds the argument for _PROBE_ELEMENTS_JS from the plain CSS locators.
+    
+    Args:
+        specs (Tuple[LocatorSpec, ...]): Element specs
+        
+    Returns:
+        List[Dict[str, str]]: [{'name': ..., 'sel': ...}] per plain CSS element
+    """
+    return [
+        {"name": name, "sel": locator}
+        for name, locator, _, _, error in specs
+        if error is None and _is_css_selector(locator)
+    ]
+
+
+def _pending_locators(
+    specs: Tuple[LocatorSpec, ...],
+    results: Mapping[str, Any],
+) -> List[Tuple[str, str]]:
+    """
+    Lists the elements the batched CSS probe could not resolve.
+    
+    Args:
+        specs (Tuple[LocatorSpec, ...]): Element specs
+        results (Mapping[str, Any]): Batched probe results by element name
+        
+    Returns:
+        List[Tuple[str, str]]: (name, locator) for each element still to probe
+    """
+    return [
+        (name, locator) for name, locator, _, _, error in specs
+        if error is None and not (name in results and results[name]['supported'])
+    ]
+
+
+def _report_results(specs: Tuple[LocatorSpec, ...], results: Mapping[str, Any]) -> bool:
+    """
+    Reports every element from its probe result and prints the summary banner.
+    
+    Args:
+        specs (Tuple[LocatorSpec, ...]): Element specs
+        results (Mapping[str, Any]): Probe result or Playwright error by element name
+        
+    Returns:
+        bool: True if all validations pass, False otherwise
+    """
+    # Bind hot attribute lookups once for the loop below
+    write = sys.stdout.write
+    all_passed = True
+    
+    for element_name, locator, matcher, description, error in specs:
+        if error is not None:
+            report, passed = _report_element(locator, matcher, description, error=ValueError(error))
+            all_passed = all_passed and passed
+            write(report)
+            continue
+        
+        result = results[element_name]
+        if isinstance(result, Exception):
+            report, passed = _report_element(locator, matcher, description, error=result)
+        else:
+            report, passed = _report_element(locator, matcher, description, result)
+        
+        all_passed = all_passed and passed
+        write(report)
+    
+    banner = '=' * 50
+    status = "🎉 All element validations PASSED!" if all_passed else "❌ Some element validations FAILED!"
+    print(f"\\n{banner}\n{status}\n{banner}")
+    return all_passed
+
+
+def _report_element(
+    locator: str,
+    matcher: Union[str, Pattern[str]],
+    description: str,
+    result: Optional[Mapping[str, Any]] = None,
+    error: Optional[Exception] = None,
+) -> Tuple[str, bool]:
+    """
+    Checks one probed element against its expected text and formats the report.
+    
+    Args:
+        locator (str): Locator string from the YAML file
+        matcher (Union[str, Pattern[str]]): Expected text or compiled pattern
+        description (str): Human readable element name
+        result (Optional[Mapping[str, Any]]): Probe result with 'visible' and 'text'
+        error (Optional[Exception]): Error raised while probing, if any
+        
+    Returns:
+        Tuple[str, bool]: The report text and whether the element passed
+    """
+    is_regex = isinstance(matcher, re.Pattern)
+    expected_text = matcher.pattern if is_regex else matcher
+    
+    buf = [
+        f"\\nValidating: {description}\n",
+        f"  Locator: {locator}\n",
+        f"  Expected text: '{expected_text}'\n",
+    ]
+    passed = False
+    
+    if error is not None:
+        buf.append(f"  ❌ ERROR: Failed to validate '{description}': {str(error)}\n")
+    elif not result['visible']:
+        buf.append(f"  ❌ ERROR: Element '{description}' is not visible on the page\n")
+    else:
+        # Compare expected vs actual text
+        actual_text = result.get('text', '')
+        if matcher.fullmatch(actual_text) if is_regex else actual_text == matcher:
+            buf.append(f"  ✅ SUCCESS: Text matches - '{actual_text}'\n")
+            passed = True
+        else:
+            buf.append(
+                f"  ❌ ERROR: Text mismatch for '{description}'\n"
+                f"     Expected: '{expected_text}'\n"
+                f"     Actual: '{actual_text}'\n"
+            )
+    
+    return "".join(buf), passed
+
+
+def _is_css_selector(locator: str) -> bool:
+    """
+    Returns True if the locator is plain CSS that document.querySelector accepts.
+    
+    Args:
+        locator (str): Locator string from the YAML file
+        
+    Returns:
+        bool: False for Playwright-specific selectors (text=, role=, :has-text, ...)
+    """
+    return bool(_CSS_RE.match(locator)) and not _PLAYWRIGHT_SELECTOR_RE.search(locator)
+
+
+def load_locator_data(yaml_file_path: str) -> Mapping[str, Any]:
     """
     Utility function to load locator data from YAML file.
     
+    Parsed files are kept in a small LRU cache and only re-read when the
+    file's modification time or size changes. Across runs, the parsed data is
+    also written to a ``<file>.<hash>.json`` sidecar keyed by the file content.
+    
+    Args:
+        yaml_file_path (str): Path to the YAML file
+        
+    Returns:
+        Mapping[str, Any]: Loaded YAML data. This is the cached object itself,
+            shared between callers, so mappings are read-only and lists are
+            returned as tuples.
+    """
+    return _load_cache_entry(yaml_file_path)[2]
+
+
+def load_locator_specs(yaml_file_path: str) -> Tuple[LocatorSpec, ...]:
+    """
+    Loads the elements of a locator YAML file as precomputed spec tuples.
+    
+    The specs are built on first use and kept with the cached file, so
+    repeated validations skip the per-element dictionary lookups and regex
+    compilation. A malformed element does not fail the load; its spec carries
+    an error message instead, to be reported for that element alone.
+    
     Args:
         yaml_file_path (str): Path to the YAML file
         
     Returns:
-        Dict[str, Any]: Loaded YAML data
+        Tuple[LocatorSpec, ...]: (name, locator, matcher, description, error) per element
+    """
+    entry = _load_cache_entry(yaml_file_path)
+    if entry[3] is None:
+        entry[3] = _compile_specs(entry[2])
+    return entry[3]
+
+
+def _load_cache_entry(yaml_file_path: str) -> _CacheEntry:
+    """
+    Returns the LRU cache entry for a YAML file, (re)loading it if it changed.
+    
+    Args:
+        yaml_file_path (str): Path to the YAML file
+        
+    Returns:
+        _CacheEntry: [st_mtime_ns, st_size, data, specs]
     """
     try:
-        with open(yaml_file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        st = os.stat(yaml_file_path)
+        key = os.path.abspath(yaml_file_path)
+        
+        entry = _YAML_CACHE.get(key)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return entry
+        
+        data = _freeze(_load_yaml_with_sidecar(key))
+        entry = [st.st_mtime_ns, st.st_size, data, None]
+        
+        _YAML_CACHE[key] = entry
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+        
+        return entry
     except Exception as e:
         print(f"Error loading YAML file {yaml_file_path}: {str(e)}")
         raise
 
+
+def _compile_specs(data: Mapping[str, Any]) -> Tuple[LocatorSpec, ...]:
+    """
+    Flattens the 'elements' section into (name, locator, matcher, description, error) tuples.
+    
+    Elements with ``regex: true`` get their expected_text compiled into a
+    pattern that must match the whole element text.
+    
+    Args:
+        data (Mapping[str, Any]): Parsed YAML data
+        
+    Returns:
+        Tuple[LocatorSpec, ...]: Element specs
+    """
+    if not isinstance(data, Mapping) or 'elements' not in data:
+        raise ValueError("YAML file must contain 'elements' key")
+    
+    specs = []
+    for name, element in data['elements'].items():
+        if not isinstance(element, Mapping):
+            specs.append((name, None, None, name, f"Element '{name}' must be a mapping"))
+            continue
+        
+        locator = element.get('locator')
+        matcher = element.get('expected_text')
+        description = element.get('description', name)
+        error = None
+        
+        missing = [field for field in ('locator', 'expected_text') if field not in element]
+        if missing:
+            error = f"Element '{name}' is missing '{missing[0]}'"
+        elif element.get('regex'):
+            try:
+                matcher = re.compile(matcher)
+            except (re.error, TypeError) as e:
+                error = f"Element '{name}' has an invalid expected_text regex: {str(e)}"
+        
+        specs.append((name, locator, matcher, description, error))
+    return tuple(specs)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively converts parsed YAML into read-only mappings and tuples.
+    
+    Args:
+        value (Any): Parsed YAML node
+        
+    Returns:
+        Any: The same data wrapped so that callers cannot modify the cache
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _load_yaml_with_sidecar(yaml_file_path: str) -> Dict[str, Any]:
+    """
+    Loads a YAML file through its JSON sidecar, (re)writing the sidecar if needed.
+    
+    Args:
+        yaml_file_path (str): Absolute path to the YAML file
+        
+    Returns:
+        Dict[str, Any]: Parsed YAML data
+    """
+    with open(yaml_file_path, 'rb') as file:
+        raw = file.read()
+    
+    content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    sidecar_path = f"{yaml_file_path}.{content_hash}.json"
+    
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable cache file {sidecar_path}: {str(e)}")
+    
+    data = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader)
+    
+    # Only cache data that survives a JSON round-trip unchanged (no dates,
+    # non-string keys, ...), so loading from the sidecar always matches the YAML
+    try:
+        encoded = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return data
+    if json.loads(encoded) != data:
+        return data
+    
+    # The sidecar is only an optimisation, never fail the load because of it
+    try:
+        tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.write(encoded)
+        os.replace(tmp_path, sidecar_path)
+        
+        # Only remove files in the sidecar format, never e.g. a user's .backup.json
+        prefix = yaml_file_path + "."
+        for stale_path in glob.glob(glob.escape(prefix) + "*.json"):
+            digest = stale_path[len(prefix):-len(".json")]
+            if stale_path != sidecar_path and re.fullmatch(r"[0-9a-f]{32}", digest):
+                os.remove(stale_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache file {sidecar_path}: {str(e)}")
+    
+    return data
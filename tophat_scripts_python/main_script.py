@@ -5,6 +5,7 @@ Main script for TopHat Playwright automation testing
 
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add project directories to Python path
@@ -13,11 +14,11 @@ sys.path.insert(0, str(project_root))
 
 # Import project modules
 from settings import settings
-from common.lib import PlaywrightManager
+from common.lib import AsyncPlaywrightManager
 
-def main():
+async def amain() -> int:
     """
-    Main function to execute the Playwright automation test
+    Executes the Playwright automation test and returns the process exit code
     """
     print("🚀 Starting Playwright Automation Test for TopHat")
     print("=" * 60)
@@ -26,17 +27,17 @@ def main():
     print("=" * 60)
     
     # Initialize Playwright manager
-    playwright_manager = PlaywrightManager()
+    playwright_manager = AsyncPlaywrightManager()
     
     try:
         # Step 1: Open browser and navigate to URL
         print("\\n📖 Step 1: Opening browser and navigating to URL...")
-        page = playwright_manager.open_url(settings.URL, settings.BROWSER)
+        page = await playwright_manager.open_url(settings.URL, settings.BROWSER)
         
         # Step 2: Validate elements from locator data
         print("\\n🔍 Step 2: Validating elements from locator data...")
         locator_file = project_root / "Locators" / "locator.yaml"
-        validation_result = playwright_manager.validate_element_from_data(str(locator_file))
+        validation_result = await playwright_manager.validate_element_from_data(str(locator_file))
         
         # Step 3: Report final results
         print("\\n📊 Step 3: Final Results")
@@ -57,10 +58,16 @@ def main():
     finally:
         # Step 4: Cleanup
         print("\\n🧹 Step 4: Cleaning up resources...")
-        playwright_manager.teardown()
+        await playwright_manager.teardown()
         
     print("\\n✅ Test execution completed.")
-    sys.exit(exit_code)
+    return exit_code
+
+def main():
+    """
+    Main function to execute the Playwright automation test
+    """
+    sys.exit(asyncio.run(amain()))
 
 if __name__ == "__main__":
     main()
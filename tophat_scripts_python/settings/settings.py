@@ -12,7 +12,12 @@ URL = BASEURL + "tophat.com/"
 BROWSER = "chromium"  # Options: chromium, firefox, webkit
 
 # Browser options
-HEADLESS = False  # Set to True for headless mode
+HEADLESS = True   # Set to False to watch the browser
 TIMEOUT = 30000   # Default timeout in milliseconds
 VIEWPORT = {"width": 1280, "height": 720}  # Browser viewport size
 
+# Shared browser (chromium only). When set, connect to a running browser over
+# CDP instead of launching a new one, e.g. "http://localhost:9222" for a
+# browser started with --remote-debugging-port=9222
+CDP_ENDPOINT = None
+